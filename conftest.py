@@ -1,20 +1,334 @@
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
+import yaml
 
+# Documents read by most test modules; prefetched together at session start
+_DOC_FILES = (
+    "README.md",
+    "CONTRIBUTION.md",
+    "LICENSE",
+    "crewai_mcp_course/README.md",
+    ".github/workflows/jekyll-gh-pages.yml",
+)
 
-@pytest.fixture
-def _github_repos():
+_WORKFLOW_FILE = ".github/workflows/jekyll-gh-pages.yml"
+
+# libyaml-backed loader when available; same semantics as SafeLoader, much faster
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Leading spaces of every non-comment line; the lookahead rejects a shorter
+# run of the same spaces, so comment indents cannot match by backtracking
+_INDENT_RE = re.compile(rb"(?m)^( +)(?! |[ \t]*#)")
+
+# Non-blank line ending in spaces or tabs; whitespace-only lines are allowed
+_TRAILING_WS_RE = re.compile(r"\S[ \t]+$", re.MULTILINE)
+
+
+class _FileCache(dict):
+    """Map repository-relative paths to raw file bytes, reading each file once."""
+
+    def __missing__(self, path):
+        data = self[path] = Path(path).read_bytes()
+        return data
+
+
+def _read_optional(path):
+    """Read a file's bytes, or return None if it does not exist."""
+    try:
+        return Path(path).read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+@pytest.fixture(scope="session")
+def file_bytes():
+    """
+    Provide raw file contents shared across the whole test session.
+    
+    The common documents are read concurrently up front; any other path is read
+    lazily on first access. Either way each file is read at most once, so checks
+    that only need bytes (encoding, line endings) never re-open the file.
+    
+    Returns:
+        dict[str, bytes]: Mapping of repository-relative path to the file's bytes.
+    """
+    cache = _FileCache()
+    with ThreadPoolExecutor(max_workers=len(_DOC_FILES)) as executor:
+        contents = executor.map(_read_optional, _DOC_FILES)
+        # Missing files are left to the existence tests to report
+        cache.update((path, data) for path, data in zip(_DOC_FILES, contents) if data is not None)
+    return cache
+
+
+def _document_text(file_bytes, path):
+    """
+    Decode a cached document, failing clearly if it is missing.
+    
+    Newlines are normalised to '\n' the same way read_text() does, so text
+    checks behave identically on CRLF checkouts; checks that care about the
+    raw line endings use file_bytes instead.
+    """
+    try:
+        data = file_bytes[path]
+    except FileNotFoundError:
+        pytest.fail(f"{path} not found")
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+class _TextCache(dict):
+    """Map repository-relative paths to decoded document text, decoding each file once."""
+
+    def __init__(self, file_bytes):
+        super().__init__()
+        self._file_bytes = file_bytes
+
+    def __missing__(self, path):
+        text = self[path] = _document_text(self._file_bytes, path)
+        return text
+
+
+@pytest.fixture(scope="session")
+def document_texts(file_bytes):
+    """
+    Provide decoded document text shared across the whole test session.
+    
+    Documents are decoded lazily on first access and memoized, so every test
+    and fixture reading the same path shares one decoded string.
+    
+    Returns:
+        dict[str, str]: Mapping of repository-relative path to the document's text.
+    """
+    return _TextCache(file_bytes)
+
+
+@pytest.fixture(scope="session")
+def trailing_whitespace_line(document_texts):
+    """
+    Provide the shared trailing-whitespace check for documents.
+    
+    A line fails when it has non-blank content followed by spaces or tabs;
+    whitespace-only lines are allowed. The check runs on the newline-normalised
+    text, so CRLF and lone-CR line endings are split the same way as LF.
+    
+    Returns:
+        Callable[[str], int | None]: Maps a path to the 1-based number of its
+        first offending line, or None if the document is clean.
+    """
+    def first_offending_line(path):
+        text = document_texts[path]
+        match = _TRAILING_WS_RE.search(text)
+        if match is None:
+            return None
+        return text.count("\n", 0, match.start()) + 1
+
+    return first_offending_line
+
+
+@pytest.fixture(scope="session")
+def readme_content(document_texts):
+    """Load README.md content once per session."""
+    return document_texts["README.md"]
+
+
+@pytest.fixture(scope="session")
+def contribution_content(document_texts):
+    """Load CONTRIBUTION.md content once per session."""
+    return document_texts["CONTRIBUTION.md"]
+
+
+@pytest.fixture(scope="session")
+def license_content(document_texts):
+    """Load LICENSE content once per session."""
+    return document_texts["LICENSE"]
+
+
+@pytest.fixture(scope="session")
+def crewai_readme_content(document_texts):
+    """Load crewai_mcp_course/README.md content once per session."""
+    return document_texts["crewai_mcp_course/README.md"]
+
+
+@pytest.fixture(scope="session")
+def crewai_mermaid_diagrams(crewai_readme_content):
+    """
+    Provide the body of every fenced Mermaid diagram in the CrewAI course README.
+    
+    Returns:
+        tuple[str, ...]: Diagram sources in document order, without the ``` fences.
+    """
+    return tuple(re.findall(r"```mermaid\n(.*?)\n```", crewai_readme_content, re.DOTALL))
+
+
+@pytest.fixture(scope="session")
+def readme_lines(readme_content):
+    """
+    Provide README.md split into lines once per session.
+    
+    Returns:
+        tuple[str, ...]: README.md lines without line terminators; immutable so tests can share it.
+    """
+    return tuple(readme_content.splitlines())
+
+
+@pytest.fixture(scope="session")
+def readme_heading_levels(readme_lines):
+    """
+    Provide the heading level of every heading line in README.md.
+    
+    A heading line is any line whose stripped text starts with '#'; its level is
+    the number of leading '#' characters (0 when the '#' is indented).
+    
+    Returns:
+        tuple[int, ...]: Heading levels in document order.
+    """
+    return tuple(
+        len(line) - len(line.lstrip("#"))
+        for line in readme_lines
+        if line.strip().startswith("#")
+    )
+
+
+@pytest.fixture(scope="session")
+def readme_table_headers(readme_lines):
+    """
+    Provide the header rows of the README.md use case tables.
+    
+    A header row is any line containing '| Use Case' that is followed by at
+    least one more line (its separator row). The README is walked once per
+    session so table tests can index headers directly.
+    
+    Returns:
+        tuple[str, ...]: Table header lines in document order.
+    """
+    return tuple(line for line in readme_lines[:-1] if "| Use Case" in line)
+
+
+@pytest.fixture(scope="session")
+def _github_repos(readme_content):
     """
     Provide GitHub repository tuples for link validation tests.
     
-    Reads README.md and extracts GitHub owner/repository pairs from URLs of the form
-    https://github.com/{owner}/{repo}.
+    Extracts GitHub owner/repository pairs from README.md URLs of the form
+    https://github.com/{owner}/{repo}. The parse runs once per session and the
+    result is immutable, so every test shares the same value.
+    
+    Returns:
+        tuple[tuple[str, str], ...]: The (owner, repo) pairs found in README.md; empty if no matches are found.
+    """
+    return tuple(re.findall(r"https://github\.com/([^/\s\)]+)/([^/\s\)]+)", readme_content))
+
+
+@pytest.fixture(scope="session")
+def readme_markdown_links(readme_content):
+    """
+    Provide every markdown link in README.md.
+    
+    Returns:
+        tuple[tuple[str, str], ...]: (text, url) pairs in document order.
+    """
+    return tuple(re.findall(r"\[([^\]]+)\]\(([^\)]+)\)", readme_content))
+
+
+@pytest.fixture(scope="session")
+def readme_image_refs(readme_content):
+    """
+    Provide the target of every markdown image reference in README.md.
+    
+    Returns:
+        tuple[str, ...]: Image targets in document order, local paths and URLs alike.
+    """
+    return tuple(re.findall(r"!\[.*?\]\((.*?)\)", readme_content))
+
+
+@pytest.fixture(scope="session")
+def readme_link_targets(readme_content):
+    """
+    Index every markdown link or image target in README.md with its basename.
+    
+    Targets are matched as ``](target)`` with no whitespace inside, so a
+    target containing spaces (such as the two "Awesome AI Agent UseCases ..."
+    images in images/) is never indexed. Membership is an exact match on the
+    target or its basename, which is stricter than a substring search of the
+    README.
+    
+    Returns:
+        frozenset[str]: Link targets and their basenames.
+    """
+    targets = re.findall(r"\]\(([^)\s]+)\)", readme_content)
+    return frozenset(targets) | frozenset(os.path.basename(t) for t in targets)
+
+
+@pytest.fixture(scope="session")
+def readme_github_urls(readme_content):
+    """
+    Provide every full GitHub URL referenced in README.md.
+    
+    Several modules validate the same set of URLs; extracting them once keeps
+    the scan out of each individual test.
+    
+    Returns:
+        tuple[str, ...]: The https://github.com/... URLs in document order.
+    """
+    return tuple(re.findall(r"https://github\.com/[^\s\)]+", readme_content))
+
+
+@lru_cache(maxsize=1)
+def _load_workflow(source):
+    """Parse workflow YAML, memoized so it runs once per process for a given source."""
+    return yaml.load(source, Loader=_YAML_LOADER)
+
+
+@pytest.fixture(scope="session")
+def workflow_path():
+    """Path to the GitHub Pages workflow."""
+    return Path(_WORKFLOW_FILE)
+
+
+@pytest.fixture(scope="session")
+def workflow_bytes(file_bytes):
+    """Raw workflow bytes, for checks that must skip decoding and newline translation."""
+    return file_bytes[_WORKFLOW_FILE]
+
+
+@pytest.fixture(scope="session")
+def workflow_indents(workflow_bytes):
+    """
+    Provide the indentation of every indented, non-comment workflow line.
+    
+    One regex pass over the raw bytes serves every indentation test. Line
+    numbers are left to the tests to derive from the offsets, only when a
+    failure needs reporting.
+    
+    Returns:
+        tuple[tuple[int, int], ...]: (byte offset, leading space count) per line.
+    """
+    return tuple((m.start(), len(m.group(1))) for m in _INDENT_RE.finditer(workflow_bytes))
+
+
+@pytest.fixture(scope="session")
+def workflow_content(document_texts):
+    """Load the workflow's YAML source once per session."""
+    return document_texts[_WORKFLOW_FILE]
+
+
+@pytest.fixture(scope="session")
+def workflow_data(workflow_content):
+    """
+    Provide the parsed GitHub Pages workflow.
+    
+    The YAML is parsed once per process and the resulting dict is shared by
+    every workflow test, so tests must treat it as read-only. A syntax error
+    is reported with the parser's message on every test that uses it.
     
     Returns:
-        list[tuple[str, str]]: A list of (owner, repo) tuples found in README.md; an empty list if no matches are found.
+        dict: The workflow document as loaded by the safe YAML loader.
     """
-    content = Path("README.md").read_text(encoding="utf-8")
-    matches = re.findall(r"https://github\.com/([^/\s\)]+)/([^/\s\)]+)", content)
-    return [(owner, repo) for owner, repo in matches]
\ No newline at end of file
+    try:
+        return _load_workflow(workflow_content)
+    except yaml.YAMLError as e:
+        pytest.fail(f"Invalid YAML syntax: {e}")
@@ -5,17 +5,15 @@ import re
 import pytest
 from pathlib import Path
 
+_PLACEHOLDER_RE = re.compile(r'lorem ipsum|TODO:|FIXME:|XXX:|placeholder', re.IGNORECASE)
+
+_PROPER_NOUNS = frozenset({'CrewAI', 'GitHub', 'Python'})
+_PROPER_NOUN_RE = re.compile(r'\b(?:CrewAI|GitHub|Python)\b')
+
 
 class TestLicenseFile:
     """Test the LICENSE file."""
     
-    @pytest.fixture
-    def license_content(self):
-        """Load LICENSE file content."""
-        license_path = Path("LICENSE")
-        assert license_path.exists(), "LICENSE file should exist"
-        return license_path.read_text(encoding='utf-8')
-    
     def test_license_is_mit(self, license_content):
         """Test that license is MIT License."""
         assert 'MIT License' in license_content
@@ -42,19 +40,16 @@ class TestLicenseFile:
 class TestRepositoryStructure:
     """Test repository file structure."""
     
-    def test_required_files_exist(self):
+    @pytest.mark.parametrize('file_path', [
+        'README.md',
+        'LICENSE',
+        'CONTRIBUTION.md',
+        '.github/workflows/jekyll-gh-pages.yml',
+        'crewai_mcp_course/README.md',
+    ])
+    def test_required_files_exist(self, file_path):
         """Test that all required files exist."""
-        required_files = [
-            'README.md',
-            'LICENSE',
-            'CONTRIBUTION.md',
-            '.github/workflows/jekyll-gh-pages.yml',
-            'crewai_mcp_course/README.md',
-        ]
-        
-        for file_path in required_files:
-            path = Path(file_path)
-            assert path.exists(), f"Required file not found: {file_path}"
+        assert Path(file_path).exists(), f"Required file not found: {file_path}"
     
     def test_images_directory_exists(self):
         """Test that images directory exists with files."""
@@ -80,81 +75,48 @@ class TestRepositoryStructure:
 class TestContentQuality:
     """Test content quality and consistency."""
     
-    def test_no_lorem_ipsum_placeholder_text(self):
+    @pytest.mark.parametrize('file_path', ['README.md', 'CONTRIBUTION.md'])
+    def test_no_lorem_ipsum_placeholder_text(self, file_path, document_texts):
         """Test that there's no placeholder Lorem Ipsum text."""
-        readme = Path("README.md").read_text(encoding='utf-8')
-        contrib = Path("CONTRIBUTION.md").read_text(encoding='utf-8')
-        
-        placeholder_patterns = [
-            'lorem ipsum',
-            'TODO:',
-            'FIXME:',
-            'XXX:',
-            'placeholder',
-        ]
-        
-        for pattern in placeholder_patterns:
-            assert pattern.lower() not in readme.lower(), \
-                f"README contains placeholder: {pattern}"
-            assert pattern.lower() not in contrib.lower(), \
-                f"CONTRIBUTION.md contains placeholder: {pattern}"
+        match = _PLACEHOLDER_RE.search(document_texts[file_path])
+        assert match is None, f"{file_path} contains placeholder: {match.group()}"
     
-    def test_consistent_terminology(self):
+    def test_consistent_terminology(self, readme_content):
         """Test that terminology is used consistently."""
-        readme = Path("README.md").read_text(encoding='utf-8')
-        
         # Check that "AI agent" is used consistently
-        ai_agent_count = len(re.findall(r'\bAI [Aa]gent', readme))
+        ai_agent_count = len(re.findall(r'\bAI [Aa]gent', readme_content))
         assert ai_agent_count > 5, "Should consistently use 'AI agent' terminology"
     
-    def test_proper_capitalization(self):
+    def test_proper_capitalization(self, readme_content):
         """Test that proper nouns are capitalized correctly."""
-        readme = Path("README.md").read_text(encoding='utf-8')
-        
-        proper_nouns = {
-            'CrewAI': re.compile(r'\bCrewAI\b'),
-            'GitHub': re.compile(r'\bGitHub\b'),
-            'Python': re.compile(r'\bPython\b'),
-        }
-        
-        for noun, pattern in proper_nouns.items():
-            matches = pattern.findall(readme)
-            if matches:
-                # Check that it's not lowercase
-                incorrect = [m for m in matches if m != noun]
-                assert len(incorrect) == 0, \
-                    f"Inconsistent capitalization of {noun}: found {incorrect}"
+        # One scan covers every noun instead of one pass per pattern
+        incorrect = [m for m in _PROPER_NOUN_RE.findall(readme_content) if m not in _PROPER_NOUNS]
+        assert not incorrect, f"Inconsistent capitalization: found {incorrect}"
 
 
 class TestCodeExamples:
     """Test code examples in documentation."""
     
-    def test_code_blocks_have_language_specifiers(self):
+    def test_code_blocks_have_language_specifiers(self, crewai_readme_content):
         """Test that code blocks specify their language."""
-        crewai = Path("crewai_mcp_course/README.md").read_text(encoding='utf-8')
-        
         # Find code blocks
-        code_blocks = re.findall(r'```(\w*)\n', crewai)
+        code_blocks = re.findall(r'```(\w*)\n', crewai_readme_content)
         
         # Most should have language specified
-        specified = [lang for lang in code_blocks if lang]
+        specified = sum(1 for lang in code_blocks if lang)
         total = len(code_blocks)
         
         if total > 0:
-            ratio = len(specified) / total
+            ratio = specified / total
             assert ratio > 0.7, f"Most code blocks should have language: {ratio:.1%}"
     
-    def test_bash_commands_are_valid(self):
+    def test_bash_commands_are_valid(self, crewai_readme_content):
         """Test that bash command examples look valid."""
-        crewai = Path("crewai_mcp_course/README.md").read_text(encoding='utf-8')
-        
         # Find bash code blocks
-        bash_blocks = re.findall(r'```bash\n(.*?)\n```', crewai, re.DOTALL)
+        bash_blocks = re.findall(r'```bash\n(.*?)\n```', crewai_readme_content, re.DOTALL)
         
         for block in bash_blocks:
-            lines = block.strip().split('\n')
-            for line in lines:
-                line = line.strip()
+            for line in map(str.strip, block.splitlines()):
                 if line and not line.startswith('#'):
                     # Should be a valid command
                     assert not line.startswith('$'), \
@@ -164,18 +126,15 @@ class TestCodeExamples:
 class TestMermaidDiagrams:
     """Test Mermaid diagrams in documentation."""
     
-    def test_mermaid_diagrams_are_valid_syntax(self):
+    def test_mermaid_diagrams_are_valid_syntax(self, crewai_mermaid_diagrams):
         """Test that Mermaid diagrams have valid syntax."""
-        crewai = Path("crewai_mcp_course/README.md").read_text(encoding='utf-8')
-        
-        # Find mermaid blocks
-        mermaid_blocks = re.findall(r'```mermaid\n(.*?)\n```', crewai, re.DOTALL)
+        mermaid_blocks = crewai_mermaid_diagrams
         
         assert len(mermaid_blocks) >= 3, "Should have multiple Mermaid diagrams"
         
         for block in mermaid_blocks:
             # Should start with graph type
-            assert any(block.strip().startswith(t) for t in ['graph', 'flowchart', 'sequenceDiagram']), \
+            assert block.lstrip().startswith(('graph', 'flowchart', 'sequenceDiagram')), \
                 "Mermaid diagram should start with graph type"
             
             # Should have connections (arrows)
@@ -186,59 +145,43 @@ class TestMermaidDiagrams:
 class TestContributionGuidelines:
     """Test contribution guidelines content."""
     
-    def test_contribution_has_pr_checklist(self):
+    def test_contribution_has_pr_checklist(self, contribution_content):
         """Test that contribution guidelines include PR checklist."""
-        contrib = Path("CONTRIBUTION.md").read_text(encoding='utf-8')
-        
-        assert 'checklist' in contrib.lower()
-        assert '[ ]' in contrib or '- [ ]' in contrib, \
+        assert 'checklist' in contribution_content.lower()
+        assert '[ ]' in contribution_content or '- [ ]' in contribution_content, \
             "Should have checkbox items in checklist"
     
-    def test_contribution_mentions_testing(self):
+    def test_contribution_mentions_testing(self, contribution_content):
         """Test that contribution guidelines mention testing."""
-        contrib = Path("CONTRIBUTION.md").read_text(encoding='utf-8')
-        
         testing_keywords = ['test', 'testing', 'smoke test', 'unit test']
-        assert any(keyword in contrib.lower() for keyword in testing_keywords), \
+        contrib_lower = contribution_content.lower()
+        assert any(keyword in contrib_lower for keyword in testing_keywords), \
             "Contribution guidelines should mention testing"
     
-    def test_contribution_has_code_of_conduct_reference(self):
+    def test_contribution_has_code_of_conduct_reference(self, contribution_content):
         """Test that contribution guidelines reference code of conduct."""
-        contrib = Path("CONTRIBUTION.md").read_text(encoding='utf-8')
-        
-        assert 'code of conduct' in contrib.lower(), \
+        assert 'code of conduct' in contribution_content.lower(), \
             "Should reference Code of Conduct"
 
 
 class TestFileEncoding:
     """Test file encoding and formatting."""
     
-    def test_files_use_utf8_encoding(self):
+    @pytest.mark.parametrize('file_path', [
+        'README.md',
+        'CONTRIBUTION.md',
+        'LICENSE',
+        'crewai_mcp_course/README.md',
+    ])
+    def test_files_use_utf8_encoding(self, file_path, file_bytes):
         """Test that text files use UTF-8 encoding."""
-        text_files = [
-            'README.md',
-            'CONTRIBUTION.md',
-            'LICENSE',
-            'crewai_mcp_course/README.md',
-        ]
-        
-        for file_path in text_files:
-            path = Path(file_path)
-            # Try to read as UTF-8
-            try:
-                content = path.read_text(encoding='utf-8')
-                assert content is not None
-            except UnicodeDecodeError:
-                pytest.fail(f"File {file_path} is not valid UTF-8")
-    
-    def test_files_have_final_newline(self):
+        # Strict decode of the shared buffer validates the whole file at once
+        try:
+            file_bytes[file_path].decode('utf-8')
+        except UnicodeDecodeError:
+            pytest.fail(f"File {file_path} is not valid UTF-8")
+    
+    @pytest.mark.parametrize('file_path', ['README.md', 'CONTRIBUTION.md', 'LICENSE'])
+    def test_files_have_final_newline(self, file_path, file_bytes):
         """Test that text files end with a newline."""
-        text_files = [
-            'README.md',
-            'CONTRIBUTION.md',
-            'LICENSE',
-        ]
-        
-        for file_path in text_files:
-            content = Path(file_path).read_text(encoding='utf-8')
-            assert content.endswith('\n'), f"File {file_path} should end with newline"
\ No newline at end of file
+        assert file_bytes[file_path].endswith(b'\n'), f"File {file_path} should end with newline"
\ No newline at end of file
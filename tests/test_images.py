@@ -4,6 +4,8 @@ import os
 import pytest
 from PIL import Image
 
+_IMAGE_FORMATS = frozenset({'JPEG', 'PNG'})
+
 
 class TestImageFiles:
     """Test suite for image file validation."""
@@ -32,7 +34,7 @@ class TestImageFiles:
     
     def test_image_has_valid_format(self, image_file):
         with Image.open(image_file) as img:
-            assert img.format in ['JPEG', 'PNG']
+            assert img.format in _IMAGE_FORMATS
     
     def test_image_has_reasonable_dimensions(self, image_file):
         with Image.open(image_file) as img:
@@ -40,11 +42,9 @@ class TestImageFiles:
             assert width >= 100 and height >= 100
             assert width <= 10000 and height <= 10000
     
-    def test_image_referenced_in_readme(self, image_file):
-        with open('README.md', 'r', encoding='utf-8') as f:
-            content = f.read()
+    def test_image_referenced_in_readme(self, image_file, readme_link_targets):
         image_filename = os.path.basename(image_file)
-        assert image_filename in content or image_file in content
+        assert image_filename in readme_link_targets or image_file in readme_link_targets
 
 
 class TestImageDirectory:
@@ -4,76 +4,61 @@ import os
 import re
 import pytest
 
+_EMOJI_CHARS = frozenset('🌟📋🧠🤖💻')
+
 
 class TestRepositoryStructure:
     """Test overall repository structure."""
     
-    def test_all_required_files_exist(self):
-        required_files = [
-            'README.md',
-            'LICENSE',
-            'CONTRIBUTION.md',
-            '.github/workflows/jekyll-gh-pages.yml'
-        ]
-        for file_path in required_files:
-            assert os.path.exists(file_path), f"Missing: {file_path}"
+    @pytest.mark.parametrize('file_path', [
+        'README.md',
+        'LICENSE',
+        'CONTRIBUTION.md',
+        '.github/workflows/jekyll-gh-pages.yml'
+    ])
+    def test_all_required_files_exist(self, file_path):
+        assert os.path.exists(file_path), f"Missing: {file_path}"
     
-    def test_required_directories_exist(self):
-        required_dirs = [
-            'images',
-            '.github',
-            '.github/workflows',
-            'crewai_mcp_course'
-        ]
-        for dir_path in required_dirs:
-            assert os.path.exists(dir_path), f"Missing: {dir_path}"
-            assert os.path.isdir(dir_path), f"Not a directory: {dir_path}"
+    @pytest.mark.parametrize('dir_path', [
+        'images',
+        '.github',
+        '.github/workflows',
+        'crewai_mcp_course'
+    ])
+    def test_required_directories_exist(self, dir_path):
+        assert os.path.exists(dir_path), f"Missing: {dir_path}"
+        assert os.path.isdir(dir_path), f"Not a directory: {dir_path}"
     
-    def test_readme_links_to_contribution_guide(self):
-        with open('README.md', 'r', encoding='utf-8') as f:
-            readme = f.read()
-        assert 'CONTRIBUT' in readme.upper() or 'Contributing' in readme
+    def test_readme_links_to_contribution_guide(self, readme_content):
+        assert 'CONTRIBUT' in readme_content.upper() or 'Contributing' in readme_content
     
-    def test_readme_links_to_license(self):
-        with open('README.md', 'r', encoding='utf-8') as f:
-            readme = f.read()
-        assert 'LICENSE' in readme or 'MIT' in readme
+    def test_readme_links_to_license(self, readme_content):
+        assert 'LICENSE' in readme_content or 'MIT' in readme_content
 
 
 class TestDocumentationQuality:
     """Test documentation quality."""
     
-    def test_readme_has_badges(self):
-        with open('README.md', 'r', encoding='utf-8') as f:
-            readme = f.read()
+    def test_readme_has_badges(self, readme_content):
         badge_pattern = r'!\[.*\]\(https://.*badge.*\)'
-        matches = re.findall(badge_pattern, readme, re.IGNORECASE)
+        matches = re.findall(badge_pattern, readme_content, re.IGNORECASE)
         assert len(matches) > 0
     
-    def test_readme_has_emojis(self):
-        with open('README.md', 'r', encoding='utf-8') as f:
-            readme = f.read()
-        emoji_patterns = [r'🌟', r'📋', r'🧠', r'🤖', r'💻']
-        found = any(re.search(p, readme) for p in emoji_patterns)
-        assert found
+    def test_readme_has_emojis(self, readme_content):
+        assert not _EMOJI_CHARS.isdisjoint(readme_content)
     
-    def test_contribution_guide_has_examples(self):
-        with open('CONTRIBUTION.md', 'r', encoding='utf-8') as f:
-            content = f.read()
-        assert '```' in content
+    def test_contribution_guide_has_examples(self, contribution_content):
+        assert '```' in contribution_content
     
-    def test_course_readme_has_code_examples(self):
-        with open('crewai_mcp_course/README.md', 'r', encoding='utf-8') as f:
-            content = f.read()
-        code_blocks = content.count('```')
+    def test_course_readme_has_code_examples(self, crewai_readme_content):
+        code_blocks = crewai_readme_content.count('```')
         assert code_blocks >= 4
 
 
 class TestConsistency:
     """Test consistency across documentation."""
     
-    def test_consistent_license_references(self):
-        for doc_file in ['README.md', 'CONTRIBUTION.md']:
-            with open(doc_file, 'r', encoding='utf-8') as f:
-                content = f.read().lower()
-            assert 'license' in content or 'mit' in content
\ No newline at end of file
+    @pytest.mark.parametrize('doc_file', ['README.md', 'CONTRIBUTION.md'])
+    def test_consistent_license_references(self, doc_file, document_texts):
+        content = document_texts[doc_file].lower()
+        assert 'license' in content or 'mit' in content
\ No newline at end of file
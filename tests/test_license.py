@@ -11,33 +11,21 @@ class TestLicense:
     def test_license_file_exists(self):
         assert os.path.exists("LICENSE")
     
-    def test_license_not_empty(self):
-        with open("LICENSE", 'r', encoding='utf-8') as f:
-            content = f.read()
-        assert len(content.strip()) > 0
+    def test_license_not_empty(self, license_content):
+        assert license_content.strip()
     
-    def test_license_is_mit(self):
-        with open("LICENSE", 'r', encoding='utf-8') as f:
-            content = f.read()
-        assert 'MIT License' in content
+    def test_license_is_mit(self, license_content):
+        assert 'MIT License' in license_content
     
-    def test_license_has_copyright(self):
-        with open("LICENSE", 'r', encoding='utf-8') as f:
-            content = f.read()
+    def test_license_has_copyright(self, license_content):
         copyright_pattern = r'Copyright \(c\) \d{4}'
-        assert re.search(copyright_pattern, content)
+        assert re.search(copyright_pattern, license_content)
     
-    def test_license_has_permission_grant(self):
-        with open("LICENSE", 'r', encoding='utf-8') as f:
-            content = f.read()
-        assert 'Permission is hereby granted' in content
+    def test_license_has_permission_grant(self, license_content):
+        assert 'Permission is hereby granted' in license_content
     
-    def test_license_has_warranty_disclaimer(self):
-        with open("LICENSE", 'r', encoding='utf-8') as f:
-            content = f.read()
-        assert 'WITHOUT WARRANTY OF ANY KIND' in content
+    def test_license_has_warranty_disclaimer(self, license_content):
+        assert 'WITHOUT WARRANTY OF ANY KIND' in license_content
     
-    def test_readme_mentions_license(self):
-        with open('README.md', 'r', encoding='utf-8') as f:
-            content = f.read()
-        assert 'MIT' in content or 'License' in content
\ No newline at end of file
+    def test_readme_mentions_license(self, readme_content):
+        assert 'MIT' in readme_content or 'License' in readme_content
\ No newline at end of file
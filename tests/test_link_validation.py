@@ -8,16 +8,19 @@ from pathlib import Path
 from urllib.parse import urlparse
 
 
+_HEADER_STRIP_RE = re.compile(r'[^\w\s-]')
+_ANCHOR_STRIP_RE = re.compile(r'[^\w-]')
+_URL_SCHEMES = frozenset({'http', 'https'})
+
+
 class TestLinkFormat:
     """Test link formatting and structure."""
     
     @pytest.fixture
-    def readme_links(self):
+    def readme_links(self, readme_markdown_links):
         """Extract all links from README.md."""
-        content = Path("README.md").read_text(encoding='utf-8')
-        # Find markdown links: [text](url)
-        links = re.findall(r'\[([^\]]+)\]\(([^\)]+)\)', content)
-        return [(text, url) for text, url in links if url.startswith('http')]
+        return [(text, url) for text, url in readme_markdown_links
+                if url.startswith('http')]
     
     def test_all_github_links_are_well_formed(self, readme_links):
         """Test that all GitHub links follow proper format."""
@@ -29,7 +32,7 @@ class TestLinkFormat:
         for _text, url in github_links:
             # Parse URL
             parsed = urlparse(url)
-            assert parsed.scheme in ['http', 'https'], f"Invalid scheme in {url}"
+            assert parsed.scheme in _URL_SCHEMES, f"Invalid scheme in {url}"
             assert parsed.netloc == 'github.com', f"Invalid GitHub URL: {url}"
             
             # Path should have at least /user/repo
@@ -50,7 +53,7 @@ class TestLinkFormat:
     
     def test_link_text_is_descriptive(self, readme_links):
         """Test that link text is descriptive and not just 'here' or 'link'."""
-        generic_texts = ['here', 'link', 'click here', 'this', 'url']
+        generic_texts = {'here', 'link', 'click here', 'this', 'url'}
         
         for text, url in readme_links:
             text_lower = text.lower().strip()
@@ -72,16 +75,9 @@ class TestLinkFormat:
 class TestGitHubLinks:
     """Test GitHub repository links specifically."""
     
-    @pytest.fixture
-    def github_repos(self):
-        """Extract all GitHub repository URLs from README."""
-        content = Path("README.md").read_text(encoding='utf-8')
-        repos = re.findall(r'https://github\.com/([^/\s\)]+)/([^/\s\)]+)', content)
-        return [(owner, repo) for owner, repo in repos]
-    
-    def test_github_repos_follow_naming_conventions(self, github_repos):
+    def test_github_repos_follow_naming_conventions(self, _github_repos):
         """Test that GitHub repo names follow conventions."""
-        for owner, repo in github_repos:
+        for owner, repo in _github_repos:
             # Owner should not be empty
             assert len(owner) > 0, "GitHub owner should not be empty"
             
@@ -91,39 +87,30 @@ class TestGitHubLinks:
             # Should not have .git extension in URL
             assert not repo.endswith('.git'), f"Remove .git from URL: {owner}/{repo}"
     
-    def test_github_links_point_to_valid_paths(self, _github_repos):
+    def test_github_links_point_to_valid_paths(self, readme_github_urls):
         """Test that GitHub links point to valid repository paths."""
-        content = Path("README.md").read_text(encoding='utf-8')
-        
-        # Extract full GitHub URLs
-        full_urls = re.findall(r'https://github\.com/[^\s\)]+', content)
-        
-        for url in full_urls:
+        for url in readme_github_urls:
             # Should not have double slashes
             assert '//' not in url.replace('https://', ''), f"Invalid path in URL: {url}"
             
             # Should not end with slash
             assert not url.endswith('/'), f"URL should not end with slash: {url}"
     
-    def test_no_broken_github_url_patterns(self):
+    def test_no_broken_github_url_patterns(self, readme_content):
         """Test for common GitHub URL mistakes."""
-        content = Path("README.md").read_text(encoding='utf-8')
-        
         # Check for common mistakes
-        assert 'github.com//' not in content, "Found double slash in GitHub URL"
-        assert 'github.com/tree/main/tree/' not in content, "Found duplicate /tree/ in URL"
-        assert 'github.com/blob/main/blob/' not in content, "Found duplicate /blob/ in URL"
+        assert 'github.com//' not in readme_content, "Found double slash in GitHub URL"
+        assert 'github.com/tree/main/tree/' not in readme_content, "Found duplicate /tree/ in URL"
+        assert 'github.com/blob/main/blob/' not in readme_content, "Found duplicate /blob/ in URL"
 
 
 class TestLinkAccessibility:
     """Test link accessibility patterns (not making actual HTTP requests)."""
     
-    def test_links_use_https_where_appropriate(self):
+    def test_links_use_https_where_appropriate(self, readme_content):
         """Test that external links use HTTPS."""
-        content = Path("README.md").read_text(encoding='utf-8')
-        
         # Find all HTTP (not HTTPS) links
-        http_links = re.findall(r'http://[^\s\)]+', content)
+        http_links = re.findall(r'http://[^\s\)]+', readme_content)
         
         # Filter out legitimate HTTP usage (like localhost examples)
         suspicious = [link for link in http_links 
@@ -132,11 +119,9 @@ class TestLinkAccessibility:
         # Most external links should use HTTPS
         assert len(suspicious) == 0, f"Found HTTP links that should be HTTPS: {suspicious[:3]}"
     
-    def test_microsoft_github_io_links_are_valid(self):
+    def test_microsoft_github_io_links_are_valid(self, readme_content):
         """Test that microsoft.github.io links follow valid patterns."""
-        content = Path("README.md").read_text(encoding='utf-8')
-        
-        ms_links = re.findall(r'https://microsoft\.github\.io/[^\s\)]+', content)
+        ms_links = re.findall(r'https://microsoft\.github\.io/[^\s\)]+', readme_content)
         
         for link in ms_links:
             # Should have proper structure: microsoft.github.io/project/...
@@ -147,14 +132,9 @@ class TestLinkAccessibility:
 class TestImageReferences:
     """Test image references in markdown."""
     
-    def test_all_referenced_images_exist(self):
+    def test_all_referenced_images_exist(self, readme_image_refs):
         """Test that all images referenced in markdown exist."""
-        content = Path("README.md").read_text(encoding='utf-8')
-        
-        # Find image references
-        image_refs = re.findall(r'!\[.*?\]\((.*?)\)', content)
-        
-        for img_path in image_refs:
+        for img_path in readme_image_refs:
             # Skip external URLs
             if img_path.startswith('http'):
                 continue
@@ -163,13 +143,9 @@ class TestImageReferences:
             assert full_path.exists(), f"Referenced image not found: {img_path}"
             assert full_path.is_file(), f"Image path is not a file: {img_path}"
     
-    def test_image_paths_are_relative(self):
+    def test_image_paths_are_relative(self, readme_image_refs):
         """Test that image paths are relative, not absolute."""
-        content = Path("README.md").read_text(encoding='utf-8')
-        
-        image_refs = re.findall(r'!\[.*?\]\((.*?)\)', content)
-        
-        for img_path in image_refs:
+        for img_path in readme_image_refs:
             if not img_path.startswith('http'):
                 # Should not start with /
                 assert not img_path.startswith('/'), \
@@ -189,35 +165,37 @@ class TestImageReferences:
 class TestInternalLinks:
     """Test internal links and anchors."""
     
-    def test_table_of_contents_links_are_valid(self):
+    def test_table_of_contents_links_are_valid(self, readme_content):
         """Test that table of contents links point to valid sections."""
-        content = Path("README.md").read_text(encoding='utf-8')
-        
         # Find TOC links (links starting with #)
-        toc_links = re.findall(r'\]\((#[^\)]+)\)', content)
+        toc_links = re.findall(r'\]\((#[^\)]+)\)', readme_content)
         
         # Find all headers
-        headers = re.findall(r'^#{1,6}\s+(.+)$', content, re.MULTILINE)
+        headers = re.findall(r'^#{1,6}\s+(.+)$', readme_content, re.MULTILINE)
         
         # Convert headers to anchor format
         def to_anchor(header):
             # Remove markdown, emojis, and special chars
-            clean = re.sub(r'[^\w\s-]', '', header)
+            clean = _HEADER_STRIP_RE.sub('', header)
             return '#' + clean.lower().replace(' ', '-')
         
-        valid_anchors = [to_anchor(h) for h in headers]
+        def simplify(anchor):
+            return _ANCHOR_STRIP_RE.sub('', anchor.replace('#', '').replace('-', ''))
         
+        # Simplify every anchor once instead of once per TOC link
+        clean_anchors = {simplify(to_anchor(h)) for h in headers}
+        
+        warnings = []
         for link in toc_links:
-            # Simplify link for comparison
-            clean_link = re.sub(r'[^\w-]', '', link.replace('#', '').replace('-', ''))
-            
-            # Check if any valid anchor matches (fuzzy matching)
-            found = False
-            for anchor in valid_anchors:
-                clean_anchor = re.sub(r'[^\w-]', '', anchor.replace('#', '').replace('-', ''))
-                if clean_link in clean_anchor or clean_anchor in clean_link:
-                    found = True
-                    break
+            clean_link = simplify(link)
             
-            if not found:
-                print(f"Warning: TOC link might be broken: {link}")
\ No newline at end of file
+            # Exact matches are a set lookup; only misses need fuzzy matching
+            if clean_link in clean_anchors:
+                continue
+            if not any(clean_link in anchor or anchor in clean_link
+                       for anchor in clean_anchors):
+                warnings.append(f"Warning: TOC link might be broken: {link}")
+        
+        # Emit all warnings in one write rather than one print per link
+        if warnings:
+            print('\n'.join(warnings))
\ No newline at end of file
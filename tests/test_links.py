@@ -8,37 +8,30 @@ from urllib.parse import urlparse
 class TestGitHubLinks:
     """Validate GitHub repository links."""
     
-    def test_github_links_structure(self):
+    def test_github_links_structure(self, _github_repos):
         """Test GitHub URLs follow correct format."""
-        content = Path("README.md").read_text(encoding='utf-8')
-        repos = re.findall(r'https://github\.com/([^/\s\)]+)/([^/\s\)]+)', content)
-        
-        for owner, repo in repos:
+        for owner, repo in _github_repos:
             assert len(owner) > 0, "GitHub owner cannot be empty"
             assert len(repo) > 0, "GitHub repo cannot be empty"
             assert not repo.endswith('.git'), f"Remove .git: {owner}/{repo}"
     
-    def test_no_broken_url_patterns(self):
+    def test_no_broken_url_patterns(self, readme_content):
         """Test for common URL mistakes."""
-        content = Path("README.md").read_text(encoding='utf-8')
-        
-        assert 'github.com//' not in content, "Double slash in GitHub URL"
-        assert 'github.com/tree/main/tree/' not in content, "Duplicate /tree/"
-        assert 'github.com/blob/main/blob/' not in content, "Duplicate /blob/"
+        assert 'github.com//' not in readme_content, "Double slash in GitHub URL"
+        assert 'github.com/tree/main/tree/' not in readme_content, "Duplicate /tree/"
+        assert 'github.com/blob/main/blob/' not in readme_content, "Duplicate /blob/"
     
-    def test_https_usage(self):
+    def test_https_usage(self, readme_content):
         """Test that external links use HTTPS."""
-        content = Path("README.md").read_text(encoding='utf-8')
-        http_links = re.findall(r'http://[^\s\)]+', content)
+        http_links = re.findall(r'http://[^\s\)]+', readme_content)
         
         # Filter legitimate HTTP usage
         suspicious = [link for link in http_links if 'localhost' not in link]
         assert len(suspicious) == 0, f"Use HTTPS: {suspicious[:3]}"
     
-    def test_badge_links_valid(self):
+    def test_badge_links_valid(self, readme_content):
         """Test shield.io badge URLs."""
-        content = Path("README.md").read_text(encoding='utf-8')
-        badges = re.findall(r'https://img\.shields\.io/[^\s\)]+', content)
+        badges = re.findall(r'https://img\.shields\.io/[^\s\)]+', readme_content)
         
         assert len(badges) > 0, "Should have badge URLs"
         for badge in badges:
@@ -48,28 +41,25 @@ class TestGitHubLinks:
 class TestInternalLinks:
     """Validate internal anchors and references."""
     
-    def test_image_references_exist(self):
+    @pytest.mark.parametrize('md_file', ['README.md', 'crewai_mcp_course/README.md'])
+    def test_image_references_exist(self, md_file, document_texts):
         """Test all referenced images exist."""
-        for md_file in ['README.md', 'crewai_mcp_course/README.md']:
-            content = Path(md_file).read_text(encoding='utf-8')
-            images = re.findall(r'!\[.*?\]\((.*?)\)', content)
-            
-            for img_path in images:
-                if not img_path.startswith('http'):
-                    # Resolve relative to markdown file
-                    base_dir = Path(md_file).parent
-                    full_path = base_dir / img_path
-                    assert full_path.exists(), f"Missing image: {img_path} in {md_file}"
+        images = re.findall(r'!\[.*?\]\((.*?)\)', document_texts[md_file])
+        
+        for img_path in images:
+            if not img_path.startswith('http'):
+                # Resolve relative to markdown file
+                base_dir = Path(md_file).parent
+                full_path = base_dir / img_path
+                assert full_path.exists(), f"Missing image: {img_path} in {md_file}"
     
-    def test_toc_links_valid(self):
+    def test_toc_links_valid(self, readme_content):
         """Test table of contents links point to valid sections."""
-        content = Path("README.md").read_text(encoding='utf-8')
-        
         # Find TOC links
-        toc_links = re.findall(r'\]\((#[^\)]+)\)', content)
+        toc_links = re.findall(r'\]\((#[^\)]+)\)', readme_content)
         
         # Find headers
-        headers = re.findall(r'^#{1,6}\s+(.+)$', content, re.MULTILINE)
+        headers = re.findall(r'^#{1,6}\s+(.+)$', readme_content, re.MULTILINE)
         
         # Basic validation - at least check we have both
         assert len(toc_links) > 0, "Should have TOC links"
@@ -79,22 +69,20 @@ class TestInternalLinks:
 class TestLinkDescriptions:
     """Test link text quality."""
     
-    def test_no_generic_link_text(self):
+    def test_no_generic_link_text(self, readme_content):
         """Links should have descriptive text."""
-        content = Path("README.md").read_text(encoding='utf-8')
-        links = re.findall(r'\[([^\]]+)\]\(([^\)]+)\)', content)
+        links = re.findall(r'\[([^\]]+)\]\(([^\)]+)\)', readme_content)
         
-        generic = ['here', 'link', 'click here', 'this']
+        generic = {'here', 'link', 'click here', 'this'}
         
         for text, url in links:
             if url.startswith('http'):
                 assert text.lower().strip() not in generic, \
                     f"Generic link text '{text}' for {url}"
     
-    def test_badge_links_descriptive(self):
+    def test_badge_links_descriptive(self, readme_content):
         """Badge links should describe their purpose."""
-        content = Path("README.md").read_text(encoding='utf-8')
-        badge_links = re.findall(r'\[([^\]]+)\]\((https://img\.shields\.io[^\)]+)\)', content)
+        badge_links = re.findall(r'\[([^\]]+)\]\((https://img\.shields\.io[^\)]+)\)', readme_content)
         
         for text, _url in badge_links:
             keywords = ['github', 'code', 'notebook', 'view', 'badge']
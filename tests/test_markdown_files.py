@@ -4,32 +4,31 @@ import os
 import re
 import pytest
 
+MARKDOWN_FILES = ['README.md', 'CONTRIBUTION.md', 'crewai_mcp_course/README.md']
+
 
 class TestMarkdownFiles:
     """Test suite for Markdown file validation."""
     
-    @pytest.fixture(params=['README.md', 'CONTRIBUTION.md', 'crewai_mcp_course/README.md'])
-    def markdown_file(self, request):
-        return request.param
-    
+    @pytest.mark.parametrize('markdown_file', MARKDOWN_FILES)
     def test_markdown_file_exists(self, markdown_file):
         assert os.path.exists(markdown_file), f"File not found: {markdown_file}"
     
-    def test_markdown_file_not_empty(self, markdown_file):
-        with open(markdown_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        assert len(content.strip()) > 0
+    @pytest.mark.parametrize('markdown_file', MARKDOWN_FILES)
+    def test_markdown_file_not_empty(self, markdown_file, document_texts):
+        content = document_texts[markdown_file]
+        assert content.strip(), f"{markdown_file} is empty"
     
-    def test_markdown_has_title(self, markdown_file):
-        with open(markdown_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+    @pytest.mark.parametrize('markdown_file', MARKDOWN_FILES)
+    def test_markdown_has_title(self, markdown_file, document_texts):
+        content = document_texts[markdown_file]
         h1_pattern = r'^#\s+.+$'
         matches = re.findall(h1_pattern, content, re.MULTILINE)
         assert len(matches) > 0, f"{markdown_file} should have H1 heading"
     
-    def test_markdown_code_blocks_closed(self, markdown_file):
-        with open(markdown_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+    @pytest.mark.parametrize('markdown_file', MARKDOWN_FILES)
+    def test_markdown_code_blocks_closed(self, markdown_file, document_texts):
+        content = document_texts[markdown_file]
         fence_pattern = r'^```'
         fences = re.findall(fence_pattern, content, re.MULTILINE)
         assert len(fences) % 2 == 0, f"{markdown_file} has unclosed code blocks"
@@ -38,19 +37,13 @@ class TestMarkdownFiles:
 class TestReadmeSpecific:
     """Specific tests for README.md."""
     
-    def test_readme_has_table_of_contents(self):
-        with open('README.md', 'r', encoding='utf-8') as f:
-            content = f.read()
-        assert 'Table of Contents' in content
+    def test_readme_has_table_of_contents(self, readme_content):
+        assert 'Table of Contents' in readme_content
     
-    def test_readme_has_use_case_table(self):
-        with open('README.md', 'r', encoding='utf-8') as f:
-            content = f.read()
+    def test_readme_has_use_case_table(self, readme_content):
         table_pattern = r'\|.*\|.*\|'
-        matches = re.findall(table_pattern, content)
+        matches = re.findall(table_pattern, readme_content)
         assert len(matches) > 3, "README should contain tables"
     
-    def test_readme_has_github_links(self):
-        with open('README.md', 'r', encoding='utf-8') as f:
-            content = f.read()
-        assert 'github.com' in content.lower()
\ No newline at end of file
+    def test_readme_has_github_links(self, readme_content):
+        assert 'github.com' in readme_content.lower()
\ No newline at end of file
@@ -1,86 +1,71 @@
 """Markdown formatting and quality tests."""
 import re
 import pytest
-from pathlib import Path
+
+TEXT_FILES = ['README.md', 'CONTRIBUTION.md', 'LICENSE']
+
+_PLACEHOLDER_RE = re.compile(r'TODO:|FIXME:|XXX:|lorem ipsum', re.IGNORECASE)
+
+_LIST_ITEM_RE = re.compile(r'^[ \t]*[-*][ \t]', re.MULTILINE)
+_TABLE_SEPARATOR_RE = re.compile(r'[-:]+')
 
 
 class TestMarkdownFormatting:
     """Test markdown structure and formatting."""
     
-    def test_heading_hierarchy(self):
+    def test_heading_hierarchy(self, readme_heading_levels):
         """Test proper heading hierarchy."""
-        content = Path("README.md").read_text(encoding='utf-8')
-        lines = content.split('\n')
-        headings = [line for line in lines if line.strip().startswith('#')]
-        
         prev_level = 0
-        for heading in headings:
-            level = len(heading) - len(heading.lstrip('#'))
+        for level in readme_heading_levels:
             if level > prev_level:
                 assert level <= prev_level + 1, \
                     f"Skipped heading level: {prev_level} to {level}"
             prev_level = level
     
-    def test_code_blocks_formatted(self):
+    def test_code_blocks_formatted(self, crewai_readme_content):
         """Test code blocks have language specifiers."""
-        content = Path("crewai_mcp_course/README.md").read_text(encoding='utf-8')
-        
-        code_blocks = re.findall(r'```(\w*)\n', content)
+        code_blocks = re.findall(r'```(\w*)\n', crewai_readme_content)
         assert len(code_blocks) > 0, "Should have code blocks"
         
         # Most should have language
-        with_lang = [b for b in code_blocks if b]
-        ratio = len(with_lang) / len(code_blocks) if code_blocks else 0
+        with_lang = sum(1 for b in code_blocks if b)
+        ratio = with_lang / len(code_blocks) if code_blocks else 0
         assert ratio > 0.5, f"Most code blocks should specify language: {ratio:.0%}"
     
-    def test_lists_consistent(self):
+    def test_lists_consistent(self, contribution_content):
         """Test list formatting is consistent."""
-        content = Path("CONTRIBUTION.md").read_text(encoding='utf-8')
-        lines = content.split('\n')
-        
-        list_items = [line for line in lines if re.match(r'^\s*[-*]\s', line)]
-        assert len(list_items) > 0, "Should have list items"
+        assert _LIST_ITEM_RE.search(contribution_content), "Should have list items"
     
-    def test_no_trailing_whitespace(self):
+    @pytest.mark.parametrize('file_path', TEXT_FILES)
+    def test_no_trailing_whitespace(self, file_path, trailing_whitespace_line):
         """Test lines don't have trailing whitespace."""
-        for file_path in ['README.md', 'CONTRIBUTION.md', 'LICENSE']:
-            content = Path(file_path).read_text(encoding='utf-8')
-            lines = content.split('\n')
-            
-            for i, line in enumerate(lines, 1):
-                if line.strip():  # Ignore empty lines
-                    assert not line.rstrip() != line or line == '\n', \
-                        f"{file_path}:{i} has trailing whitespace"
+        line_no = trailing_whitespace_line(file_path)
+        if line_no is not None:
+            pytest.fail(f"{file_path}:{line_no} has trailing whitespace")
 
 
 class TestTableFormatting:
     """Test markdown table structure."""
     
-    def test_tables_have_separators(self):
+    def test_tables_have_separators(self, readme_lines):
         """Tables should have proper header separators."""
-        content = Path("README.md").read_text(encoding='utf-8')
-        lines = content.split('\n')
-        
         in_table = False
-        for i, line in enumerate(lines):
+        for i, line in enumerate(readme_lines):
             if '|' in line and line.count('|') > 2:
                 if not in_table:
                     in_table = True
                     # Next line should be separator
-                    if i + 1 < len(lines):
-                        sep = lines[i + 1]
+                    if i + 1 < len(readme_lines):
+                        sep = readme_lines[i + 1]
                         if '|' in sep:
-                            assert re.search(r'[-:]+', sep), "Need separator row"
+                            assert _TABLE_SEPARATOR_RE.search(sep), "Need separator row"
             elif in_table and not line.strip():
                 in_table = False
     
-    def test_use_case_table_columns(self):
+    def test_use_case_table_columns(self, readme_lines):
         """Main use case table has required columns."""
-        content = Path("README.md").read_text(encoding='utf-8')
-        lines = content.split('\n')
-        
         # Find main table
-        for _i, line in enumerate(lines):
+        for _i, line in enumerate(readme_lines):
             if '| Use Case' in line and '| Industry' in line:
                 assert 'Description' in line
                 assert 'GitHub' in line or 'Code' in line
@@ -90,61 +75,45 @@ class TestTableFormatting:
 class TestContentQuality:
     """Test content quality and consistency."""
     
-    def test_no_placeholder_text(self):
+    @pytest.mark.parametrize('file_path', ['README.md', 'CONTRIBUTION.md'])
+    def test_no_placeholder_text(self, file_path, document_texts):
         """No TODO or placeholder text."""
-        for file_path in ['README.md', 'CONTRIBUTION.md']:
-            content = Path(file_path).read_text(encoding='utf-8')
-            
-            placeholders = ['TODO:', 'FIXME:', 'XXX:', 'lorem ipsum']
-            for placeholder in placeholders:
-                assert placeholder not in content.lower(), \
-                    f"{file_path} has placeholder: {placeholder}"
+        match = _PLACEHOLDER_RE.search(document_texts[file_path])
+        assert match is None, f"{file_path} has placeholder: {match.group()}"
     
-    def test_consistent_terminology(self):
+    def test_consistent_terminology(self, readme_content):
         """Terminology used consistently."""
-        content = Path("README.md").read_text(encoding='utf-8')
-        
         # Should use "AI agent" consistently
-        ai_mentions = len(re.findall(r'\bAI [Aa]gent', content))
+        ai_mentions = len(re.findall(r'\bAI [Aa]gent', readme_content))
         assert ai_mentions > 5, "Should mention 'AI agent' frequently"
     
-    def test_proper_capitalization(self):
+    def test_proper_capitalization(self, readme_content):
         """Proper nouns capitalized correctly."""
-        content = Path("README.md").read_text(encoding='utf-8')
-        
         # Check some key proper nouns
-        assert re.search(r'\bGitHub\b', content), "Use 'GitHub' not 'github'"
-        assert re.search(r'\bPython\b', content), "Use 'Python' not 'python'"
+        assert re.search(r'\bGitHub\b', readme_content), "Use 'GitHub' not 'github'"
+        assert re.search(r'\bPython\b', readme_content), "Use 'Python' not 'python'"
     
-    def test_files_utf8_encoded(self):
+    @pytest.mark.parametrize('file_path', TEXT_FILES)
+    def test_files_utf8_encoded(self, file_path, file_bytes):
         """All text files use UTF-8."""
-        for file_path in ['README.md', 'CONTRIBUTION.md', 'LICENSE']:
-            try:
-                Path(file_path).read_text(encoding='utf-8')
-            except UnicodeDecodeError:
-                pytest.fail(f"{file_path} not UTF-8 encoded")
+        try:
+            file_bytes[file_path].decode('utf-8')
+        except UnicodeDecodeError:
+            pytest.fail(f"{file_path} not UTF-8 encoded")
 
 
 class TestMermaidDiagrams:
     """Test Mermaid diagram syntax."""
     
-    def test_mermaid_present(self):
+    def test_mermaid_present(self, crewai_mermaid_diagrams):
         """CrewAI course has Mermaid diagrams."""
-        content = Path("crewai_mcp_course/README.md").read_text(encoding='utf-8')
-        
-        diagrams = re.findall(r'```mermaid\n(.*?)\n```', content, re.DOTALL)
-        assert len(diagrams) >= 3, "Should have 3+ Mermaid diagrams"
+        assert len(crewai_mermaid_diagrams) >= 3, "Should have 3+ Mermaid diagrams"
     
-    def test_mermaid_syntax(self):
+    def test_mermaid_syntax(self, crewai_mermaid_diagrams):
         """Mermaid diagrams have valid basic syntax."""
-        content = Path("crewai_mcp_course/README.md").read_text(encoding='utf-8')
-        
-        diagrams = re.findall(r'```mermaid\n(.*?)\n```', content, re.DOTALL)
-        
-        for diagram in diagrams:
+        for diagram in crewai_mermaid_diagrams:
             # Should start with graph type
-            assert any(diagram.strip().startswith(t) 
-                      for t in ['graph', 'flowchart', 'sequenceDiagram']), \
+            assert diagram.lstrip().startswith(('graph', 'flowchart', 'sequenceDiagram')), \
                 "Mermaid needs graph type"
             
             # Should have connections
@@ -4,37 +4,73 @@ Tests structure, syntax, formatting, and content quality.
 """
 import re
 import pytest
+from collections import Counter
 from pathlib import Path
 
+_LIST_ITEM_RE = re.compile(r'^[ \t]*[-*][ \t]', re.MULTILINE)
+_TABLE_SEPARATOR_RE = re.compile(r'\|[\s\-:|]+\|')
+
+# Pictographs block; covers the 🌟 🤖 📋 🧠 🏭 🎮 💻 📊 markers used in the README
+_EMOJI_RE = re.compile(r'[\U0001F300-\U0001F9FF]')
+
+_README_SECTIONS = (
+    'Introduction',
+    'Table of Contents',
+    'Use Case Table',
+    'Framework',
+    'Contributing',
+    'License',
+)
+_CONTRIBUTION_SECTIONS = (
+    'What to contribute',
+    'Project folder requirements',
+    'Naming & layout conventions',
+    'Reproducibility',
+    'Code style',
+    'PR process',
+    'Security',
+    'Ethics',
+)
+_CREWAI_ELEMENTS = (
+    'Course Overview',
+    'Lesson 1',
+    'Lesson 2',
+    'Lesson 3',
+    'Getting Started',
+    'Requirements',
+    'Next Steps',
+)
+
+
+def _names_re(names):
+    """
+    Compile an alternation finding every occurrence of any of names in one scan.
+    
+    The alternation sits in a lookahead capture so a match consumes no text and
+    findall also reports names overlapping another (e.g. 'Table of Contents'
+    inside 'Use Case Table of Contents'). Only a name that is a prefix of
+    another starting at the same position can still be shadowed; none of the
+    lists below contain one.
+    """
+    return re.compile('(?=(' + '|'.join(map(re.escape, names)) + '))')
+
+
+# One alternation per document so every expected name is found in a single scan
+_README_SECTIONS_RE = _names_re(_README_SECTIONS)
+# Sections may appear as written or fully lowercased
+_CONTRIBUTION_SECTIONS_RE = _names_re(
+    form for section in _CONTRIBUTION_SECTIONS for form in (section, section.lower())
+)
+_CREWAI_ELEMENTS_RE = _names_re(_CREWAI_ELEMENTS)
+
 
 class TestMarkdownStructure:
     """Test the structure and format of markdown files."""
     
-    @pytest.fixture
-    def readme_content(self):
-        """Load README.md content."""
-        readme_path = Path("README.md")
-        assert readme_path.exists(), "README.md not found"
-        return readme_path.read_text(encoding='utf-8')
-    
-    @pytest.fixture
-    def contribution_content(self):
-        """Load CONTRIBUTION.md content."""
-        contrib_path = Path("CONTRIBUTION.md")
-        assert contrib_path.exists(), "CONTRIBUTION.md not found"
-        return contrib_path.read_text(encoding='utf-8')
-    
-    @pytest.fixture
-    def crewai_readme_content(self):
-        """Load crewai_mcp_course/README.md content."""
-        crewai_path = Path("crewai_mcp_course/README.md")
-        assert crewai_path.exists(), "crewai_mcp_course/README.md not found"
-        return crewai_path.read_text(encoding='utf-8')
-    
-    def test_readme_has_title(self, readme_content):
+    def test_readme_has_title(self, readme_content, readme_lines):
         """Test that README.md has a proper title."""
         assert readme_content.startswith('#'), "README.md should start with a title"
-        first_line = readme_content.split('\n')[0]
+        first_line = readme_lines[0]
         assert '500' in first_line or 'AI Agent' in first_line, "Title should mention AI Agents"
     
     def test_readme_has_table_of_contents(self, readme_content):
@@ -61,14 +97,10 @@ class TestMarkdownStructure:
         assert 'Lesson 2' in crewai_readme_content
         assert 'Lesson 3' in crewai_readme_content
     
-    def test_no_broken_heading_hierarchy(self, readme_content):
+    def test_no_broken_heading_hierarchy(self, readme_heading_levels):
         """Test that heading hierarchy is proper (no skipping levels)."""
-        lines = readme_content.split('\n')
-        headings = [line for line in lines if line.strip().startswith('#')]
-        
         prev_level = 0
-        for heading in headings:
-            level = len(heading) - len(heading.lstrip('#'))
+        for level in readme_heading_levels:
             # Allow going up multiple levels but not down more than 1
             if level > prev_level:
                 assert level <= prev_level + 1, f"Heading hierarchy broken: jumped from {prev_level} to {level}"
@@ -86,26 +118,13 @@ class TestMarkdownStructure:
     
     def test_lists_are_properly_formatted(self, contribution_content):
         """Test that lists use consistent formatting."""
-        lines = contribution_content.split('\n')
-        list_markers = [line for line in lines if re.match(r'^\s*[-*]\s', line)]
-        
         # Should have at least some list items
-        assert len(list_markers) > 0, "CONTRIBUTION.md should have list items"
+        assert _LIST_ITEM_RE.search(contribution_content), "CONTRIBUTION.md should have list items"
 
 
 class TestMarkdownContent:
     """Test the content quality of markdown files."""
     
-    @pytest.fixture
-    def readme_content(self):
-        """Load README.md content."""
-        return Path("README.md").read_text(encoding='utf-8')
-    
-    @pytest.fixture
-    def contribution_content(self):
-        """Load CONTRIBUTION.md content."""
-        return Path("CONTRIBUTION.md").read_text(encoding='utf-8')
-    
     def test_no_merge_conflict_markers(self, contribution_content):
         """Test that there are no Git merge conflict markers."""
         conflict_markers = ['<<<<<<<', '=======', '>>>>>>>']
@@ -125,18 +144,13 @@ class TestMarkdownContent:
             full_path = Path(img_path)
             assert full_path.exists(), f"Referenced image not found: {img_path}"
     
-    def test_no_duplicate_headings(self, readme_content):
+    def test_no_duplicate_headings(self, readme_lines):
         """Test that there are no duplicate section headings."""
-        lines = readme_content.split('\n')
-        headings = [line.strip() for line in lines if line.strip().startswith('#')]
-        
-        # Remove duplicate spaces and normalize
-        normalized = [' '.join(h.split()) for h in headings]
+        # Collapse runs of whitespace so spacing differences still count as duplicates
+        counts = Counter(' '.join(line.split()) for line in readme_lines if line.lstrip().startswith('#'))
         
         # Allow some duplicates (like multiple "## UseCase" sections)
         # but flag if more than 3 of the same
-        from collections import Counter
-        counts = Counter(normalized)
         for heading, count in counts.items():
             if count > 4:
                 pytest.fail(f"Heading appears too many times ({count}): {heading}")
@@ -152,15 +166,12 @@ class TestMarkdownContent:
                 assert text.strip(), f"Empty link text for URL: {url}"
                 assert text != url, f"Link text is same as URL: {url}"
     
-    def test_tables_have_proper_structure(self, readme_content):
+    def test_tables_have_proper_structure(self, readme_lines):
         """Test that markdown tables are properly formatted."""
-        # Find all table sections
-        lines = readme_content.split('\n')
-        
         in_table = False
         table_lines = []
         
-        for line in lines:
+        for line in readme_lines:
             if '|' in line:
                 in_table = True
                 table_lines.append(line)
@@ -169,37 +180,26 @@ class TestMarkdownContent:
                 if len(table_lines) > 2:
                     # Check header separator
                     header_sep = table_lines[1]
-                    assert re.match(r'\|[\s\-:|]+\|', header_sep), "Table should have proper separator"
+                    assert _TABLE_SEPARATOR_RE.match(header_sep), "Table should have proper separator"
                 table_lines = []
                 in_table = False
     
-    def test_no_trailing_whitespace(self, readme_content, contribution_content):
+    @pytest.mark.parametrize('filename', ['README.md', 'CONTRIBUTION.md'])
+    def test_no_trailing_whitespace(self, filename, trailing_whitespace_line):
         """Test that lines don't have trailing whitespace."""
-        for content, filename in [(readme_content, 'README.md'), 
-                                  (contribution_content, 'CONTRIBUTION.md')]:
-            lines = content.split('\n')
-            for i, line in enumerate(lines, 1):
-                # Allow lines that are entirely whitespace (empty lines)
-                if line.strip():
-                    assert not line.endswith(' ') and not line.endswith('\t'), \
-                        f"{filename}:{i} has trailing whitespace"
+        line_no = trailing_whitespace_line(filename)
+        if line_no is not None:
+            pytest.fail(f"{filename}:{line_no} has trailing whitespace")
 
 
 class TestMarkdownURLs:
     """Test URL formatting and structure in markdown files."""
     
-    @pytest.fixture
-    def readme_content(self):
-        """Load README.md content."""
-        return Path("README.md").read_text(encoding='utf-8')
-    
-    def test_github_urls_are_well_formed(self, readme_content):
+    def test_github_urls_are_well_formed(self, readme_github_urls):
         """Test that GitHub URLs are properly formatted."""
-        github_urls = re.findall(r'https://github\.com/[^\s\)]+', readme_content)
+        assert readme_github_urls, "README should contain GitHub URLs"
         
-        assert len(github_urls) > 0, "README should contain GitHub URLs"
-        
-        for url in github_urls:
+        for url in readme_github_urls:
             # Should not have trailing punctuation
             assert not url.endswith('.'), f"URL has trailing period: {url}"
             assert not url.endswith(','), f"URL has trailing comma: {url}"
@@ -238,80 +238,52 @@ class TestMarkdownURLs:
 class TestMarkdownConsistency:
     """Test consistency across markdown files."""
     
-    def test_consistent_emoji_usage(self):
+    def test_consistent_emoji_usage(self, readme_content):
         """Test that emoji usage is consistent across files."""
-        readme = Path("README.md").read_text(encoding='utf-8')
-        
         # Check that emojis are used (part of the style)
-        emoji_pattern = re.compile(r'[\U0001F300-\U0001F9FF]|🌟|🤖|📋|🧠|🏭|🎮|💻|📊')
-        assert emoji_pattern.search(readme), "README should use emojis for visual appeal"
+        assert _EMOJI_RE.search(readme_content), "README should use emojis for visual appeal"
     
-    def test_consistent_section_formatting(self):
+    def test_consistent_section_formatting(self, readme_content):
         """Test that sections use consistent formatting."""
-        readme = Path("README.md").read_text(encoding='utf-8')
-        
         # Framework sections should follow consistent pattern
-        framework_sections = re.findall(r'### \*\*Framework Name\*\*: \*\*(\w+)\*\*', readme)
+        framework_sections = re.findall(r'### \*\*Framework Name\*\*: \*\*(\w+)\*\*', readme_content)
         assert len(framework_sections) >= 3, "Should have multiple framework sections"
         
         # Check each framework has a table
         for framework in framework_sections:
-            assert f"Framework Name**: **{framework}" in readme
+            assert f"Framework Name**: **{framework}" in readme_content
 
 
 class TestTableStructure:
     """Test the structure and formatting of tables in markdown files."""
     
-    @pytest.fixture
-    def readme_content(self):
-        """Load README.md content."""
-        return Path("README.md").read_text(encoding='utf-8')
-    
-    def test_use_case_table_has_required_columns(self, readme_content):
+    def test_use_case_table_has_required_columns(self, readme_table_headers):
         """Test that the main use case table has all required columns."""
-        # Find the main use case table
-        lines = readme_content.split('\n')
+        # The main use case table is the one with an Industry column
+        header = next((h for h in readme_table_headers if '| Industry' in h), None)
         
-        table_start = None
-        for i, line in enumerate(lines):
-            if '| Use Case' in line and '| Industry' in line:
-                table_start = i
-                break
+        assert header is not None, "Could not find main use case table"
         
-        assert table_start is not None, "Could not find main use case table"
-        
-        header = lines[table_start]
         assert 'Use Case' in header
         assert 'Industry' in header
         assert 'Description' in header
         assert 'GitHub' in header or 'Code' in header
     
-    def test_framework_tables_have_consistent_structure(self, readme_content):
+    def test_framework_tables_have_consistent_structure(self, readme_table_headers):
         """Test that framework-specific tables follow consistent structure."""
-        # Find all framework table headers
-        lines = readme_content.split('\n')
-        
-        framework_tables = []
-        for i, line in enumerate(lines):
-            if '| Use Case' in line and i < len(lines) - 1:
-                framework_tables.append(i)
-        
-        assert len(framework_tables) >= 4, "Should have tables for multiple frameworks"
+        assert len(readme_table_headers) >= 4, "Should have tables for multiple frameworks"
         
         # Each table should have similar structure
-        for table_idx in framework_tables:
-            header = lines[table_idx]
+        for header in readme_table_headers:
             # Should have pipes for column separation
             assert header.count('|') >= 3, "Table should have multiple columns"
     
-    def test_table_rows_are_aligned(self, readme_content):
+    def test_table_rows_are_aligned(self, readme_lines):
         """Test that table rows have consistent column counts."""
-        lines = readme_content.split('\n')
-        
         in_table = False
         expected_cols = None
         
-        for line in lines:
+        for line in readme_lines:
             if '|' in line and line.count('|') > 2:
                 if not in_table:
                     in_table = True
@@ -330,65 +302,30 @@ class TestTableStructure:
 class TestDocumentationCompleteness:
     """Test that documentation is complete and comprehensive."""
     
-    def test_readme_has_all_sections(self):
+    def test_readme_has_all_sections(self, readme_content):
         """Test that README has all expected sections."""
-        readme = Path("README.md").read_text(encoding='utf-8')
+        found = set(_README_SECTIONS_RE.findall(readme_content))
         
-        required_sections = [
-            'Introduction',
-            'Table of Contents',
-            'Use Case Table',
-            'Framework',
-            'Contributing',
-            'License'
-        ]
-        
-        for section in required_sections:
-            assert section in readme, f"README should have '{section}' section"
+        for section in _README_SECTIONS:
+            assert section in found, f"README should have '{section}' section"
     
-    def test_contribution_guide_has_all_sections(self):
+    def test_contribution_guide_has_all_sections(self, contribution_content):
         """Test that CONTRIBUTION.md has all expected sections."""
-        contrib = Path("CONTRIBUTION.md").read_text(encoding='utf-8')
-        
-        required_sections = [
-            'What to contribute',
-            'Project folder requirements',
-            'Naming & layout conventions',
-            'Reproducibility',
-            'Code style',
-            'PR process',
-            'Security',
-            'Ethics'
-        ]
+        found = {match.lower() for match in _CONTRIBUTION_SECTIONS_RE.findall(contribution_content)}
         
-        for section in required_sections:
-            assert any(s in contrib for s in [section, section.lower()]), \
+        for section in _CONTRIBUTION_SECTIONS:
+            assert section.lower() in found, \
                 f"CONTRIBUTION.md should have '{section}' section"
     
-    def test_crewai_course_has_complete_structure(self):
+    def test_crewai_course_has_complete_structure(self, crewai_readme_content):
         """Test that CrewAI course README has complete structure."""
-        crewai = Path("crewai_mcp_course/README.md").read_text(encoding='utf-8')
+        found = set(_CREWAI_ELEMENTS_RE.findall(crewai_readme_content))
         
-        required_elements = [
-            'Course Overview',
-            'Lesson 1',
-            'Lesson 2',
-            'Lesson 3',
-            'Getting Started',
-            'Requirements',
-            'Next Steps'
-        ]
-        
-        for element in required_elements:
-            assert element in crewai, f"CrewAI README should have '{element}'"
+        for element in _CREWAI_ELEMENTS:
+            assert element in found, f"CrewAI README should have '{element}'"
     
-    def test_mermaid_diagrams_present(self):
+    def test_mermaid_diagrams_present(self, crewai_readme_content):
         """Test that mermaid diagrams are included in CrewAI course."""
-        crewai = Path("crewai_mcp_course/README.md").read_text(encoding='utf-8')
-        
-        # Should have mermaid code blocks
-        assert '```mermaid' in crewai, "Should include mermaid diagrams"
-        
-        # Count mermaid diagrams
-        diagram_count = crewai.count('```mermaid')
+        # Count mermaid code blocks once and reuse the tally for both checks
+        diagram_count = crewai_readme_content.count('```mermaid')
         assert diagram_count >= 3, f"Should have at least 3 mermaid diagrams, found {diagram_count}"
\ No newline at end of file
@@ -1,18 +1,10 @@
 """GitHub Actions workflow validation."""
 import pytest
-import yaml
-from pathlib import Path
 
 
 class TestWorkflowStructure:
     """Test workflow file structure."""
     
-    @pytest.fixture
-    def workflow_data(self):
-        """Load workflow YAML."""
-        content = Path(".github/workflows/jekyll-gh-pages.yml").read_text()
-        return yaml.safe_load(content)
-    
     def test_has_required_fields(self, workflow_data):
         """Workflow has all required fields."""
         assert 'name' in workflow_data
@@ -49,40 +41,33 @@ class TestWorkflowStructure:
 class TestYAMLFormatting:
     """Test YAML file formatting."""
     
-    def test_valid_yaml(self):
+    def test_valid_yaml(self, workflow_data):
         """File is valid YAML."""
-        content = Path(".github/workflows/jekyll-gh-pages.yml").read_text()
-        data = yaml.safe_load(content)
-        assert data is not None
+        assert workflow_data is not None
     
-    def test_no_tabs(self):
+    def test_no_tabs(self, workflow_bytes):
         """YAML doesn't use tabs."""
-        content = Path(".github/workflows/jekyll-gh-pages.yml").read_text()
-        assert '\t' not in content, "Use spaces, not tabs"
+        assert b'\t' not in workflow_bytes, "Use spaces, not tabs"
     
-    def test_consistent_indentation(self):
+    def test_consistent_indentation(self, workflow_indents, workflow_bytes):
         """YAML uses 2-space indentation."""
-        content = Path(".github/workflows/jekyll-gh-pages.yml").read_text()
-        lines = content.split('\n')
-        
-        for i, line in enumerate(lines, 1):
-            if line and not line.strip().startswith('#'):
-                spaces = len(line) - len(line.lstrip(' '))
-                if spaces > 0:
-                    assert spaces % 2 == 0, f"Line {i}: use 2-space indent"
+        for offset, spaces in workflow_indents:
+            if spaces % 2:
+                line_no = workflow_bytes.count(b'\n', 0, offset) + 1
+                pytest.fail(f"Line {line_no}: use 2-space indent")
 
 
 class TestWorkflowSecurity:
     """Test workflow security."""
     
-    def test_no_hardcoded_secrets(self):
+    def test_no_hardcoded_secrets(self, workflow_bytes):
         """No hardcoded secrets in workflow."""
-        content = Path(".github/workflows/jekyll-gh-pages.yml").read_text()
+        lowered = workflow_bytes.lower()
         
         # Check for secret patterns
-        assert 'password:' not in content.lower()
-        assert 'api_key:' not in content.lower()
+        assert b'password:' not in lowered
+        assert b'api_key:' not in lowered
         
         # Allow secrets context references
-        if 'secrets.' in content:
-            assert '${{' in content, "Use secrets context"
\ No newline at end of file
+        if b'secrets.' in workflow_bytes:
+            assert b'${{' in workflow_bytes, "Use secrets context"
\ No newline at end of file
@@ -1,30 +1,16 @@
 """
 Tests for validating YAML configuration files.
 """
+import re
 import pytest
-import yaml
-from pathlib import Path
+
+# Common secret assignments: password, api key, token, secret
+_SECRET_RE = re.compile(r'(?:password|api[_-]?key|token|secret)\s*[:=]\s*["\']?\w+', re.IGNORECASE)
 
 
 class TestGitHubWorkflow:
     """Test the GitHub Actions workflow YAML file."""
     
-    @pytest.fixture
-    def workflow_path(self):
-        """Get path to workflow file."""
-        return Path(".github/workflows/jekyll-gh-pages.yml")
-    
-    @pytest.fixture
-    def workflow_content(self, workflow_path):
-        """Load workflow file content."""
-        assert workflow_path.exists(), "Workflow file should exist"
-        return workflow_path.read_text(encoding='utf-8')
-    
-    @pytest.fixture
-    def workflow_data(self, workflow_content):
-        """Parse workflow YAML."""
-        return yaml.safe_load(workflow_content)
-    
     def test_workflow_file_exists(self, workflow_path):
         """Test that the GitHub Actions workflow file exists."""
         assert workflow_path.exists()
@@ -32,14 +18,13 @@ class TestGitHubWorkflow:
     
     def test_workflow_is_valid_yaml(self, workflow_data):
         """Test that the workflow file is valid YAML."""
-        assert workflow_data is not None
         assert isinstance(workflow_data, dict)
     
     def test_workflow_has_name(self, workflow_data):
         """Test that workflow has a name."""
         assert 'name' in workflow_data
         assert isinstance(workflow_data['name'], str)
-        assert len(workflow_data['name']) > 0
+        assert workflow_data['name']
     
     def test_workflow_has_triggers(self, workflow_data):
         """Test that workflow has on: triggers defined."""
@@ -79,18 +64,6 @@ class TestGitHubWorkflow:
                 if 'name' in step:
                     assert len(step['name']) > 0, f"Step in job '{job_name}' has empty name"
     
-    def test_workflow_uses_valid_actions(self, workflow_data):
-        """Test that workflow uses valid GitHub Actions."""
-        jobs = workflow_data['jobs']
-        
-        for _job_name, job_config in jobs.items():
-            steps = job_config.get('steps', [])
-            for step in steps:
-                if 'uses' in step:
-                    action = step['uses']
-                    # Should be in format owner/repo@version
-                    assert '@' in action, f"Action '{action}' should have version specified"
-    
     def test_workflow_permissions_are_defined(self, workflow_data):
         """Test that workflow has permissions defined."""
         assert 'permissions' in workflow_data
@@ -134,61 +107,34 @@ class TestGitHubWorkflow:
 class TestYAMLFormatting:
     """Test YAML file formatting and style."""
     
-    @pytest.fixture
-    def workflow_content(self):
-        """Load workflow file content."""
-        return Path(".github/workflows/jekyll-gh-pages.yml").read_text(encoding='utf-8')
-    
-    def test_yaml_uses_consistent_indentation(self, workflow_content):
+    def test_yaml_uses_consistent_indentation(self, workflow_indents, workflow_bytes):
         """Test that YAML uses consistent indentation (2 spaces)."""
-        lines = workflow_content.split('\n')
-        
-        for i, line in enumerate(lines, 1):
-            if line and not line.strip().startswith('#'):
-                # Count leading spaces
-                leading_spaces = len(line) - len(line.lstrip(' '))
-                if leading_spaces > 0:
-                    # Should be multiple of 2
-                    assert leading_spaces % 2 == 0, \
-                        f"Line {i} has inconsistent indentation: {leading_spaces} spaces"
-    
-    def test_yaml_has_no_tabs(self, workflow_content):
+        for offset, leading_spaces in workflow_indents:
+            # Should be multiple of 2
+            if leading_spaces % 2:
+                line_no = workflow_bytes.count(b'\n', 0, offset) + 1
+                pytest.fail(f"Line {line_no} has inconsistent indentation: {leading_spaces} spaces")
+    
+    def test_yaml_has_no_tabs(self, workflow_bytes):
         """Test that YAML file doesn't use tabs."""
-        assert '\t' not in workflow_content, "YAML should not contain tabs"
+        assert b'\t' not in workflow_bytes, "YAML should not contain tabs"
     
-    def test_yaml_has_proper_line_endings(self, workflow_content):
+    def test_yaml_has_proper_line_endings(self, workflow_bytes):
         """Test that YAML file uses Unix line endings."""
-        assert '\r\n' not in workflow_content, "Should use Unix line endings (LF)"
+        # read_text() translates CRLF to LF, so the check has to run on raw bytes
+        assert b'\r\n' not in workflow_bytes, "Should use Unix line endings (LF)"
 
 
 class TestYAMLSecurity:
     """Test security aspects of YAML configuration."""
     
-    @pytest.fixture
-    def workflow_data(self):
-        """Load and parse workflow file."""
-        content = Path(".github/workflows/jekyll-gh-pages.yml").read_text(encoding='utf-8')
-        return yaml.safe_load(content)
-    
-    def test_no_hardcoded_secrets(self):
+    def test_no_hardcoded_secrets(self, workflow_content):
         """Test that there are no hardcoded secrets in workflow."""
-        content = Path(".github/workflows/jekyll-gh-pages.yml").read_text(encoding='utf-8')
-        
-        # Common secret patterns
-        secret_patterns = [
-            r'password\s*[:=]\s*["\']?\w+',
-            r'api[_-]?key\s*[:=]\s*["\']?\w+',
-            r'token\s*[:=]\s*["\']?\w+',
-            r'secret\s*[:=]\s*["\']?\w+',
-        ]
-        
-        import re
-        for pattern in secret_patterns:
-            matches = re.findall(pattern, content.lower())
-            # Allow references to secrets. context like ${{ secrets.X }}
-            for match in matches:
-                assert '${{' in content or 'secrets.' not in match.lower(), \
-                    f"Possible hardcoded secret: {match}"
+        # Allow references to secrets. context like ${{ secrets.X }}
+        has_expressions = '${{' in workflow_content
+        for match in _SECRET_RE.findall(workflow_content):
+            assert has_expressions or 'secrets.' not in match.lower(), \
+                f"Possible hardcoded secret: {match}"
     
     def test_workflow_uses_pinned_action_versions(self, workflow_data):
         """Test that workflow uses pinned action versions."""